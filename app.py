@@ -1,19 +1,26 @@
 import streamlit as st
 import pandas as pd
 import sys
-from pathlib import Path
 
 # --- BEGIN: path safety patch (updated) ---
 # Resolve the project root directory and add it to the system path.
 # This ensures that 'from src...' imports work correctly, regardless of
 # how the script is executed (e.g., from the terminal, in an IDE, or by Streamlit).
-project_root = Path(__file__).resolve().parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+# Streamlit reruns this script in the same process, so a flag on `sys` records
+# that the root was already inserted instead of rescanning sys.path each time.
+# The root is taken from __file__ with plain string ops to avoid importing
+# pathlib just for this; `streamlit run` usually has it at sys.path[0] already.
+if not getattr(sys, "_pnl_root_added", False):
+    # Split on the separator __file__ actually uses, so the result matches the
+    # form the runner put on sys.path (backslashes on Windows).
+    project_root = __file__.rpartition('\\' if '\\' in __file__ else '/')[0]
+    # The flag is only set when we own the entry; if the runner put the root at
+    # sys.path[0] it may also remove it, so the check must run again next time.
+    if project_root and (not sys.path or sys.path[0] != project_root):
+        sys.path.insert(0, project_root)
+        sys._pnl_root_added = True
 # --- END: path safety patch ---
 
-from src.export import export_excel
-
 st.set_page_config(layout="centered")
 
 st.title("Excel Exporter App")
@@ -26,13 +33,38 @@ st.write(
 st.info("Click the button below to generate and download a sample Excel file.")
 
 # --- App Logic ---
-# Create some sample data
-data = {
-    'Product': ['Apples', 'Oranges', 'Bananas', 'Grapes'],
-    'Sales (USD)': [1200, 950, 1500, 750],
-    'Region': ['North', 'South', 'North', 'East']
-}
-df = pd.DataFrame(data)
+# The script body re-executes on every widget interaction, so the literal
+# sample data and its serialized workbook are built once and reused.
+@st.cache_resource(show_spinner=False)
+def _sample_df():
+    return pd.DataFrame({
+        'Product': ['Apples', 'Oranges', 'Bananas', 'Grapes'],
+        'Sales (USD)': [1200, 950, 1500, 750],
+        'Region': ['North', 'South', 'North', 'East']
+    })
+
+
+def _hash_df(d):
+    # Every row is hashed (Streamlit's default only samples large frames), and
+    # column labels and dtypes are included so renamed frames get their own key.
+    return (
+        tuple(d.columns),
+        tuple(str(t) for t in d.dtypes),
+        pd.util.hash_pandas_object(d, index=True).values.tobytes(),
+    )
+
+
+# Keyed on the frame's contents: one encoding per distinct frame, and repeat
+# downloads reuse the cached buffer instead of re-encoding the workbook.
+@st.cache_data(show_spinner=False, max_entries=4, hash_funcs={pd.DataFrame: _hash_df})
+def _build_xlsx(d):
+    # Imported here so the Excel writer stack is only loaded on first export
+    from src.export import export_excel
+
+    return export_excel(d)
+
+
+df = _sample_df()
 
 st.subheader("Sample Data to Export")
 st.dataframe(df, use_container_width=True)
@@ -40,8 +72,8 @@ st.dataframe(df, use_container_width=True)
 # --- Download Button ---
 if st.button("Generate Excel File", type="primary"):
     try:
-        # Call the imported function to get the Excel data in memory
-        excel_data = export_excel(df)
+        # Get the Excel data in memory (encoded once, then served from cache)
+        excel_data = _build_xlsx(df)
 
         st.balloons()
         st.success("Excel file generated successfully!")
@@ -0,0 +1,63 @@
+import io
+
+import pandas as pd
+import xlsxwriter
+
+# Rows converted to Python objects at a time; bounds the per-export overhead.
+_CHUNK_ROWS = 10_000
+
+
+def _to_writable(chunk: pd.DataFrame) -> pd.DataFrame:
+    # xlsxwriter rejects Period values and would format timedeltas as dates, so
+    # periods are written as their string form and durations as seconds.
+    out = None
+    for i, dtype in enumerate(chunk.dtypes):
+        s = chunk.iloc[:, i]
+        if isinstance(dtype, pd.PeriodDtype):
+            s = s.astype(str).where(s.notna(), None)
+        elif pd.api.types.is_timedelta64_dtype(dtype):
+            s = s.dt.total_seconds()
+        else:
+            continue
+        if out is None:
+            out = chunk.copy()
+        out.isetitem(i, s)
+    return chunk if out is None else out
+
+
+def export_excel(df: pd.DataFrame, sheet_name: str = "Sheet1") -> bytes:
+    """Serialize ``df`` to an .xlsx workbook and return its bytes.
+
+    Rows are streamed with xlsxwriter's ``constant_memory`` mode, which flushes
+    each finished row to a temp file, so memory use stays flat regardless of the
+    number of rows. That mode only accepts rows in ascending order, which is why
+    cells are written row by row here rather than through ``DataFrame.to_excel``
+    (it emits the body column by column).
+    """
+    buf = io.BytesIO()
+    # No 'in_memory' here: xlsxwriter turns constant_memory off when it is set.
+    # Text is written verbatim: no formula or hyperlink sniffing, so values
+    # starting with '=' stay plain strings rather than live formulas.
+    wb = xlsxwriter.Workbook(buf, {
+        'constant_memory': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+        'nan_inf_to_errors': True,
+        'remove_timezone': True,
+        'default_date_format': 'yyyy-mm-dd',
+    })
+    ws = wb.add_worksheet(sheet_name)
+    ws.write_row(0, 0, [str(c) for c in df.columns])
+
+    # Missing values (NaN/NaT/NA) become None, which xlsxwriter leaves blank;
+    # +/-inf are written as Excel error cells.
+    r = 1
+    for start in range(0, len(df), _CHUNK_ROWS):
+        chunk = _to_writable(df.iloc[start:start + _CHUNK_ROWS])
+        body = chunk.astype(object).where(chunk.notna(), None)
+        for row in body.itertuples(index=False, name=None):
+            ws.write_row(r, 0, row)
+            r += 1
+
+    wb.close()
+    return buf.getvalue()